@@ -37,18 +37,63 @@ db.prepare(`
   )
 `).run();
 
+// --------------------------
+// Prepared statement cache: update/find build their SQL from the
+// column names they are given, so compile each distinct query once
+// --------------------------
+const statements = new Map();
+const prepare = (sql) => {
+  let stmt = statements.get(sql);
+  if (!stmt) {
+    stmt = db.prepare(sql);
+    statements.set(sql, stmt);
+  }
+  return stmt;
+};
+
+// --------------------------
+// Fixed statements, compiled once at startup
+// --------------------------
+const insertStmt = db.prepare(`
+  INSERT INTO policies
+    (policyId, userAddress, flightRef, policyStatus, attestationId, attestationStatus, merkleProof, payoutAmount)
+  VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+`);
+const getStmt = db.prepare(`SELECT * FROM policies WHERE policyId = ?`);
+
+// --------------------------
+// Update helpers
+// --------------------------
+const updatePolicy = (policyId, updates) => {
+  const fields = [];
+  const values = [];
+
+  for (const key in updates) {
+    fields.push(`${key} = ?`);
+    // Store Merkle proofs as JSON string
+    if (key === "merkleProof" && updates[key]) {
+      values.push(JSON.stringify(updates[key]));
+    } else {
+      values.push(updates[key]);
+    }
+  }
+
+  const stmt = prepare(`UPDATE policies SET ${fields.join(", ")} WHERE policyId = ?`);
+  stmt.run(...values, policyId);
+};
+
+// One commit (and one fsync) for a whole batch instead of one per row
+const updateManyTx = db.transaction((entries) => {
+  for (const [policyId, updates] of entries) updatePolicy(policyId, updates);
+});
+
 // --------------------------
 // DB operations
 // --------------------------
 export default {
   // Insert a new policy
   insert: (policy) => {
-    const stmt = db.prepare(`
-      INSERT INTO policies
-        (policyId, userAddress, flightRef, policyStatus, attestationId, attestationStatus, merkleProof, payoutAmount)
-      VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    `);
-    stmt.run(
+    insertStmt.run(
       policy.policyId,
       policy.userAddress,
       policy.flightRef,
@@ -61,27 +106,14 @@ export default {
   },
 
   // Update a policy by policyId
-  update: (policyId, updates) => {
-    const fields = [];
-    const values = [];
-
-    for (const key in updates) {
-      fields.push(`${key} = ?`);
-      // Store Merkle proofs as JSON string
-      if (key === "merkleProof" && updates[key]) {
-        values.push(JSON.stringify(updates[key]));
-      } else {
-        values.push(updates[key]);
-      }
-    }
+  update: (policyId, updates) => updatePolicy(policyId, updates),
 
-    const stmt = db.prepare(`UPDATE policies SET ${fields.join(", ")} WHERE policyId = ?`);
-    stmt.run(...values, policyId);
-  },
+  // Apply many [policyId, updates] pairs in a single transaction
+  updateMany: (entries) => updateManyTx(entries),
 
   // Get a single policy by policyId
   get: (policyId) => {
-    const row = db.prepare(`SELECT * FROM policies WHERE policyId = ?`).get(policyId);
+    const row = getStmt.get(policyId);
     if (!row) return null;
 
     // Parse Merkle proof JSON
@@ -92,12 +124,13 @@ export default {
   // Find policies by filters (e.g., attestationStatus = 'PENDING')
   find: (filters) => {
     const keys = Object.keys(filters);
-    if (!keys.length) return db.prepare(`SELECT * FROM policies`).all();
+    if (!keys.length) return prepare(`SELECT * FROM policies`).all();
 
-    const where = keys.map((k) => `${k} = ?`).join(" AND ");
-    const values = keys.map((k) => filters[k]);
+    // `col = NULL` never matches in SQL, so null filters need IS NULL
+    const where = keys.map((k) => (filters[k] === null ? `${k} IS NULL` : `${k} = ?`)).join(" AND ");
+    const values = keys.filter((k) => filters[k] !== null).map((k) => filters[k]);
 
-    const rows = db.prepare(`SELECT * FROM policies WHERE ${where}`).all(...values);
+    const rows = prepare(`SELECT * FROM policies WHERE ${where}`).all(...values);
 
     // Parse Merkle proof JSON
     rows.forEach((r) => {
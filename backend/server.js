@@ -21,15 +21,67 @@ const __dirname = path.dirname(__filename);
 const payoutEngineAbiPath = path.join(__dirname, "../apps/contracts/artifacts/contracts/PayoutEngine.sol/PayoutEngine.json");
 const insuranceAbiPath = path.join(__dirname, "../apps/contracts/artifacts/contracts/FlightInsurance.sol/FlightInsuranceFDC.json");
 
-const payoutEngineAbi = JSON.parse(fs.readFileSync(payoutEngineAbiPath, "utf8"));
-const insuranceAbi = JSON.parse(fs.readFileSync(insuranceAbiPath, "utf8"));
-
-
+// ABIs are only needed by the on-chain endpoints: read them on first use
+const abiCache = new Map();
+function loadAbi(abiPath) {
+  if (!abiCache.has(abiPath)) abiCache.set(abiPath, JSON.parse(fs.readFileSync(abiPath, "utf8")).abi);
+  return abiCache.get(abiPath);
+}
 
 dotenv.config({ path: ".env" });
 
+// One provider and wallet per process, created on the first on-chain call
+// so the RPC connection and contract instances are reused across requests
+let wallet;
+function getWallet() {
+  if (!wallet) wallet = new Wallet(process.env.PRIVATE_KEY, new JsonRpcProvider(process.env.RPC_URL));
+  return wallet;
+}
+
+// Keyed by ABI and address: two endpoints configured with the same address
+// must not share a Contract built from the other's ABI
+const contracts = new Map();
+function getContract(addressEnv, abiPath) {
+  const address = process.env[addressEnv];
+  if (!address) throw new Error(`${addressEnv} is not set`);
+
+  const key = `${abiPath}:${address}`;
+  if (!contracts.has(key)) contracts.set(key, new Contract(address, loadAbi(abiPath), getWallet()));
+  return contracts.get(key);
+}
+
+// Upper bound on concurrent upstream calls made by the watchers
+const WATCHER_CONCURRENCY = 16;
+
+// Map fn over items with at most `limit` calls in flight; results keep input order.
+// One rejection rejects the whole batch, so fn should catch its own errors
+// (log, and return a fallback if the result is used) so one bad item does
+// not sink the others.
+async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i], i);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
 const app = express();
 
+// 0x-prefixed 20-byte hex address
+const ADDRESS_RE = /^0x[0-9a-fA-F]{40}$/;
+
+// Non-negative integer that a JS number (and so the SQLite columns) holds
+// exactly; these values are packed as uint256 into the Merkle leaf
+const isSafeUint = (value) =>
+  (typeof value === "number" || (typeof value === "string" && /^\d+$/.test(value))) &&
+  Number.isSafeInteger(Number(value)) &&
+  Number(value) >= 0;
+
 // CORS configuration
 app.use(cors({
   origin: "http://localhost:3000",
@@ -55,10 +107,21 @@ app.post('/api/flight/info', async (req, res) => {
 app.post("/api/policies", async (req, res) => {
   try {
     const { policyId, userAddress, flightRef, payoutAmount } = req.body;
-    if (!policyId || !userAddress || !flightRef || !payoutAmount)
+    // On-chain policy ids start at 0, so check policyId for presence, not truthiness
+    if (policyId === undefined || policyId === null || !userAddress || !flightRef || !payoutAmount)
       return res.status(400).json({ error: "Missing fields" });
-
-    db.insert({ policyId, userAddress, flightRef, payoutAmount });
+    // Validate and lowercase the address in one step, so only a checked
+    // string is ever normalized
+    const address = typeof userAddress === "string" && ADDRESS_RE.test(userAddress) ? userAddress.toLowerCase() : null;
+    if (!address)
+      return res.status(400).json({ error: "Invalid userAddress" });
+    if (!isSafeUint(policyId))
+      return res.status(400).json({ error: "Invalid policyId" });
+    // payoutAmount lands in a REAL column: reject anything a double would round
+    if (!isSafeUint(payoutAmount))
+      return res.status(400).json({ error: "Invalid payoutAmount" });
+
+    db.insert({ policyId: Number(policyId), userAddress: address, flightRef, payoutAmount: Number(payoutAmount) });
     console.log(`[API] Policy ${policyId} registered`);
     res.status(201).json({ success: true, policyId });
   } catch (err) {
@@ -71,14 +134,28 @@ app.post("/api/policies", async (req, res) => {
 cron.schedule("* * * * *", async () => {
   try {
     const policies = db.find({ policyStatus: "ACTIVE", attestationId: null });
+
+    // Many policies insure the same flight: look it up and attest it once
+    const byFlight = new Map();
     for (const p of policies) {
-      const flight = await fetchFlight(p.flightRef);
-      if (flight.isFinal) {
-        const attestationId = await requestAttestation(flight.apiUrl);
-        db.update(p.policyId, { attestationId, attestationStatus: "PENDING" });
-        console.log(`[FlightWatcher] Requested attestation for policy ${p.policyId}`);
-      }
+      if (!byFlight.has(p.flightRef)) byFlight.set(p.flightRef, []);
+      byFlight.get(p.flightRef).push(p);
     }
+
+    // Flights are independent: process them in parallel, bounded so a large
+    // backlog does not flood the flight API or the attestation service
+    await mapWithConcurrency([...byFlight], WATCHER_CONCURRENCY, async ([flightRef, group]) => {
+      try {
+        const flight = await fetchFlight(flightRef);
+        if (flight.isFinal) {
+          const attestationId = await requestAttestation(flight.apiUrl);
+          db.updateMany(group.map((p) => [p.policyId, { attestationId, attestationStatus: "PENDING" }]));
+          for (const p of group) console.log(`[FlightWatcher] Requested attestation for policy ${p.policyId}`);
+        }
+      } catch (err) {
+        console.error(`[FlightWatcher] Error processing flight ${flightRef}:`, err);
+      }
+    });
   } catch (err) {
     console.error("[FlightWatcher]", err);
   }
@@ -88,13 +165,31 @@ cron.schedule("* * * * *", async () => {
 cron.schedule("* * * * *", async () => {
   try {
     const pending = db.find({ attestationStatus: "PENDING" });
+
+    // Policies on the same flight share an attestation: poll each one once
+    const byAttestation = new Map();
     for (const p of pending) {
-      const status = await getAttestationStatus(p.attestationId);
-      if (status === "FINALIZED") {
-        db.update(p.policyId, { attestationStatus: "FINALIZED" });
-        console.log(`[AttestationWatcher] Policy ${p.policyId} finalized`);
-      }
+      if (!byAttestation.has(p.attestationId)) byAttestation.set(p.attestationId, []);
+      byAttestation.get(p.attestationId).push(p);
     }
+
+    // Status polls are independent reads: issue them together
+    const groups = [...byAttestation];
+    const statuses = await mapWithConcurrency(groups, WATCHER_CONCURRENCY, async ([attestationId]) => {
+      try {
+        return await getAttestationStatus(attestationId);
+      } catch (err) {
+        console.error(`[AttestationWatcher] Error polling attestation ${attestationId}:`, err);
+        return null;
+      }
+    });
+
+    groups.forEach(([, group], i) => {
+      if (statuses[i] === "FINALIZED") {
+        db.updateMany(group.map((p) => [p.policyId, { attestationStatus: "FINALIZED" }]));
+        for (const p of group) console.log(`[AttestationWatcher] Policy ${p.policyId} finalized`);
+      }
+    });
   } catch (err) {
     console.error("[AttestationWatcher]", err);
   }
@@ -109,20 +204,12 @@ app.post("/api/merkle/update", async (req, res) => {
     const { root, proofs } = buildMerkleTree(eligible);
     console.log(`[MerkleUpdater] Root: ${root}`);
 
-    const provider = new JsonRpcProvider(process.env.RPC_URL);
-    const wallet = new Wallet(process.env.PRIVATE_KEY, provider);
-
-    // Create payoutEngine contract instance using ABI + address
-    const payoutEngine = new Contract(
-      process.env.PAYOUT_ENGINE_ADDRESS,
-      payoutEngineAbi.abi,
-      wallet
-    );
+    const payoutEngine = getContract("PAYOUT_ENGINE_ADDRESS", payoutEngineAbiPath);
 
     await payoutEngine.setMerkleRoot(root);
     console.log("[MerkleUpdater] Root set on-chain");
 
-    for (const p of eligible) db.update(p.policyId, { merkleProof: proofs[p.policyId] });
+    db.updateMany(eligible.map((p) => [p.policyId, { merkleProof: proofs[p.policyId] }]));
 
     res.json({ success: true, root });
   } catch (err) {
@@ -143,15 +230,7 @@ app.post("/api/verify-policy", async (req, res) => {
 
     const proof = await fetchFdcProof(policy.attestationId);
 
-    const provider = new JsonRpcProvider(process.env.RPC_URL);
-    const wallet = new Wallet(process.env.PRIVATE_KEY, provider);
-
-    // Create insurance contract instance using ABI + address
-    const insurance = new Contract(
-      process.env.INSURANCE_ADDRESS,
-      insuranceAbi.abi,
-      wallet
-    );
+    const insurance = getContract("INSURANCE_ADDRESS", insuranceAbiPath);
 
     const tx = await insurance.resolvePolicy(policyId, proof, policy.merkleProof);
     await tx.wait();
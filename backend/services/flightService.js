@@ -1,5 +1,3 @@
-import axios from "axios";
-
 export async function fetchFlight(flightRef) {
   try {
     // Replace with real API call
@@ -13,8 +11,8 @@ export async function fetchFlight(flightRef) {
 export async function requestAttestation(attestationUrl) {
   try {
     // Replace with real API call
-    // const res = await axios.post(attestationUrl);
-    // return res.data.attestationId;
+    // const res = await fetch(attestationUrl, { method: "POST" });
+    // return (await res.json()).attestationId;
     return `mock-attestation-${Date.now()}`;
   } catch (err) {
     console.error("[flightService] requestAttestation failed:", err);
@@ -1,10 +1,11 @@
-import { keccak256, toUtf8Bytes } from "ethers";
+import { keccak256, solidityPackedKeccak256 } from "ethers";
 import { MerkleTree } from "merkletreejs";
 
 export function buildMerkleTree(policies) {
   try {
-    const leaves = policies.map(
-      (p) => keccak256(toUtf8Bytes(p.userAddress.toLowerCase() + p.policyId + p.payoutAmount))
+    // Same leaf as PayoutEngine.verifyClaim: keccak256(abi.encodePacked(user, policyId, amount))
+    const leaves = policies.map((p) =>
+      solidityPackedKeccak256(["address", "uint256", "uint256"], [p.userAddress, BigInt(p.policyId), BigInt(p.payoutAmount)])
     );
 
     const tree = new MerkleTree(leaves, keccak256, { sortPairs: true });